@@ -1,14 +1,332 @@
 from typing import List, Dict, Any, Optional
+from dataclasses import dataclass, fields, asdict
 import pandas as pd
 import numpy as np
 from datetime import datetime
+import argparse
+import hashlib
+import json
+import math
 import os
+import sys
 import time
+import warnings
 
-class DataQualityValidator:
+try:
+    import yaml
+except ImportError:
+    yaml = None
+
+try:
+    import polars as pl
+except ImportError:
+    pl = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+try:
+    from crick import TDigest
+except ImportError:
+    TDigest = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+if njit is not None:
+    @njit(parallel=True, cache=True)
+    def _nb_outlier_mask(A, n_std):
+        """Per-column NaN-aware mean/sample std and outlier mask, one thread per column"""
+        n_rows, n_cols = A.shape
+        out = np.zeros((n_rows, n_cols), dtype=np.bool_)
+        for j in prange(n_cols):
+            # Welford's update gives mean and M2 in a single pass over the column
+            count = 0
+            mean = 0.0
+            m2 = 0.0
+            for i in range(n_rows):
+                v = A[i, j]
+                if not np.isnan(v):
+                    count += 1
+                    delta = v - mean
+                    mean += delta / count
+                    m2 += delta * (v - mean)
+            if count < 2:
+                continue
+            threshold = n_std * math.sqrt(m2 / (count - 1))
+            for i in range(n_rows):
+                out[i, j] = abs(A[i, j] - mean) > threshold
+        return out
+else:
+    _nb_outlier_mask = None
+
+CLEAR_SCREEN = '\x1b[2J\x1b[H'
+SCHEMA_CACHE_DIR = '.cache'
+SPEC_CHECK_KEYS = ('missing_threshold', 'duplicates', 'outlier_cols', 'iqr_outlier_cols', 'schema')
+SPEC_KEYS = frozenset(SPEC_CHECK_KEYS + ('n_std', 'iqr_k', 'max_indices', 'data'))
+
+def _partition_quantiles(x: np.ndarray, quantiles: List[float]) -> np.ndarray:
+    """
+    Linearly interpolated quantiles, as np.percentile computes them, found with
+    one O(n) np.partition instead of a full sort. Partitions x in place.
+    """
+    pos = np.asarray(quantiles) * (x.size - 1)
+    lo = np.floor(pos).astype(np.intp)
+    hi = np.minimum(lo + 1, x.size - 1)
+    x.partition(np.unique(np.concatenate([lo, hi])))
+    return x[lo] + (x[hi] - x[lo]) * (pos - lo)
+
+@dataclass(slots=True)
+class CheckResult:
+    """Outcome of a single validation check"""
+    status: bool
+    details: Dict[str, Any]
+
+@dataclass(slots=True)
+class ValidationResults:
+    """Latest result of each check, None until the check has run"""
+    missing_values: Optional[CheckResult] = None
+    duplicates: Optional[CheckResult] = None
+    outliers: Optional[CheckResult] = None
+    outliers_iqr: Optional[CheckResult] = None
+    schema: Optional[CheckResult] = None
+
+    def completed(self) -> Dict[str, CheckResult]:
+        """Return the checks that have run, keyed by check name"""
+        results = {}
+        for field in fields(self):
+            result = getattr(self, field.name)
+            if result is not None:
+                results[field.name] = result
+        return results
+
+class ValidationResultsMixin:
+    """Result bookkeeping shared by the in-memory and streaming validators"""
+
+    def _record_missing(self, problematic_cols: Dict[str, float]) -> Dict[str, float]:
+        self.results.missing_values = CheckResult(
+            status=len(problematic_cols) == 0,
+            details=problematic_cols
+        )
+        return problematic_cols
+
+    def _record_duplicates(self, duplicate_count: int) -> int:
+        self.results.duplicates = CheckResult(
+            status=duplicate_count == 0,
+            details={'duplicate_count': duplicate_count}
+        )
+        return duplicate_count
+
+    def _record_outliers(self, outliers: Dict[str, Dict[str, Any]],
+                         check: str = 'outliers') -> Dict[str, Dict[str, Any]]:
+        setattr(self.results, check, CheckResult(
+            status=all(result['count'] == 0 for result in outliers.values()),
+            details=outliers
+        ))
+        return outliers
+
+    def _record_schema(self, mismatched_cols: List[str]) -> List[str]:
+        self.results.schema = CheckResult(
+            status=len(mismatched_cols) == 0,
+            details={'mismatched_columns': mismatched_cols}
+        )
+        return mismatched_cols
+
+    def get_validation_summary(self) -> Dict[str, Any]:
+        """Return complete validation results"""
+        checks = self.results.completed()
+        return {
+            'timestamp': datetime.now().isoformat(),
+            'total_rows': self._n_rows,
+            'total_columns': self._n_cols,
+            'checks': {name: asdict(result) for name, result in checks.items()},
+            'overall_status': all(result.status for result in checks.values())
+        }
+
+class DataQualityValidator(ValidationResultsMixin):
     def __init__(self, df: pd.DataFrame):
         self.df = df
-        self.validation_results = {}
+        self.results = ValidationResults()
+
+    @property
+    def df(self) -> pd.DataFrame:
+        return self._df
+
+    @df.setter
+    def df(self, df: pd.DataFrame):
+        # Everything derived from the frame is cached per frame object
+        self._df = df
+        self._lf = self._to_lazy(df)
+        self._arrow_cache = None
+        self._numeric_cache = None
+        self._null_count_cache = None
+        self._n_rows = len(df)
+        self._n_cols = len(df.columns)
+        self._dtypes = df.dtypes.astype(str).to_dict()
+        self._numeric_cols = df.select_dtypes(include=[np.number]).columns.tolist()
+
+    def refresh(self, df: pd.DataFrame) -> None:
+        """Point the validator at a new frame, keeping results recorded so far"""
+        self.df = df
+
+    @staticmethod
+    def _to_lazy(df: pd.DataFrame):
+        """Build the Polars LazyFrame the checks run on, or None to use pandas"""
+        # Polars stringifies labels, so expressions built from the raw labels
+        # only line up when every label is already a unique string
+        if pl is None or df.columns.empty or not df.columns.is_unique or not all(isinstance(col, str) for col in df.columns):
+            return None
+        # Polars turns both None and NaN in object columns into null, which
+        # would make them duplicates of each other where pandas keeps them apart
+        if (df.dtypes == object).any():
+            return None
+        try:
+            return pl.from_pandas(df).lazy()
+        except Exception:
+            return None
+
+    @property
+    def _arrow_table(self):
+        """Arrow view of the frame, or None when pyarrow is missing or cannot convert it"""
+        if self._arrow_cache is None:
+            self._arrow_cache = False
+            if pa is not None:
+                try:
+                    self._arrow_cache = pa.Table.from_pandas(self.df, preserve_index=False)
+                except Exception:
+                    pass
+        return self._arrow_cache if self._arrow_cache is not False else None
+
+    @property
+    def _null_counts(self) -> np.ndarray:
+        """Null count per column, aligned with self.df.columns and computed once"""
+        if self._null_count_cache is None:
+            if self._n_cols == 0:
+                counts = []
+            elif self._lf is not None:
+                counts = self._lf.select(pl.all().null_count()).collect().row(0)
+            elif self._arrow_table is not None:
+                # Arrow keeps a null count with each validity bitmap
+                counts = [column.null_count for column in self._arrow_table.columns]
+            else:
+                counts = self.df.isnull().sum().to_numpy()
+            self._null_count_cache = np.asarray(counts, dtype=np.int64)
+        return self._null_count_cache
+
+    def _duplicate_expr(self, subset: Optional[List[str]], name: str = 'duplicate_count'):
+        if subset and len(subset) == 1:
+            key = pl.col(subset[0])
+        else:
+            key = pl.struct(subset or list(self.df.columns))
+        return (~key.is_first_distinct()).sum().alias(name)
+
+    def _hashed_duplicate_count(self, subset: List[str]) -> int:
+        """
+        Count duplicates over subset by hashing rows once, then confirming
+        only the rows whose hashes collide with an exact duplicated()
+        """
+        frame = self.df[subset]
+        float_cols = [i for i, dtype in enumerate(frame.dtypes) if pd.api.types.is_float_dtype(dtype)]
+        if float_cols:
+            # -0.0 == 0.0 but they hash differently, so normalise before hashing
+            frame = frame.copy(deep=False)
+            for i in float_cols:
+                frame.isetitem(i, frame.iloc[:, i] + 0.0)
+        row_hashes = pd.util.hash_pandas_object(frame, index=False)
+        candidates = row_hashes.duplicated(keep=False).to_numpy()
+        return int(frame[candidates].duplicated().sum())
+
+    def _numeric_columns(self, columns: List[str]) -> List[str]:
+        return [col for col in columns if pd.api.types.is_numeric_dtype(self.df[col])]
+
+    def _numeric_matrix(self):
+        """Return the numeric column names and their values as one float array"""
+        if self._numeric_cache is None:
+            numeric = self.df[self._numeric_cols]
+            A = numeric.to_numpy(dtype=np.float64, na_value=np.nan)
+            if self._fits_float32(numeric, A):
+                A = A.astype(np.float32)
+            self._numeric_cache = (self._numeric_cols, A)
+        return self._numeric_cache
+
+    @staticmethod
+    def _fits_float32(numeric: pd.DataFrame, A: np.ndarray) -> bool:
+        """
+        Whether float64 data can be scanned as float32 for outlier detection
+
+        Only frames whose numeric columns are all float64 qualify, so integer
+        columns never lose exact values to the 24-bit mantissa. Each column
+        must also fit the float32 range and have a standard deviation above
+        2**-12 of its largest magnitude, which keeps float32 rounding below
+        2**-12 standard deviations. Columns such as N(1e8, 1) stay float64.
+        """
+        if A.size == 0 or not all(dtype == np.float64 for dtype in numeric.dtypes):
+            return False
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            max_abs = np.nanmax(np.abs(A), axis=0)
+            std = np.nanstd(A, axis=0)
+        # All-NaN columns have nothing to lose
+        observed = ~np.isnan(max_abs)
+        max_abs, std = max_abs[observed], std[observed]
+        return bool(np.all(max_abs < np.finfo(np.float32).max) and np.all(std > max_abs * 2.0 ** -12))
+
+    def _column_matrix(self, columns: List[str]) -> np.ndarray:
+        cols, A = self._numeric_matrix()
+        if columns == cols:
+            return A
+        lookup = {col: i for i, col in enumerate(cols)}
+        if all(col in lookup for col in columns):
+            return A[:, [lookup[col] for col in columns]]
+        return self.df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+    @staticmethod
+    def _outlier_mask(A: np.ndarray, n_std: float) -> np.ndarray:
+        """Flag values further than n_std sample standard deviations from their column mean"""
+        if _nb_outlier_mask is not None:
+            return _nb_outlier_mask(A, float(n_std))
+        if A.size == 0:
+            return np.zeros(A.shape, dtype=bool)
+
+        valid = ~np.isnan(A)
+        count = valid.sum(axis=0)
+
+        # Shift each column by its first valid value so the sum of squares
+        # does not cancel catastrophically for data far from zero
+        first = A[valid.argmax(axis=0), np.arange(A.shape[1])]
+        shift = np.where(np.isnan(first), 0, first).astype(A.dtype)
+        X = A - shift
+        np.copyto(X, 0, where=~valid)
+
+        # One sum and one sum of squares, accumulated in float64 but
+        # compared in the array's own precision
+        total = X.sum(axis=0, dtype=np.float64)
+        total_sq = np.einsum('ij,ij->j', X, X, dtype=np.float64)
+        with np.errstate(invalid='ignore', divide='ignore', over='ignore'):
+            shifted_mean = total / count
+            std = np.sqrt(np.maximum(total_sq - total * shifted_mean, 0) / (count - 1))
+            mean = shifted_mean + shift
+            return np.abs(A - mean.astype(A.dtype)) > (n_std * std).astype(A.dtype)
+
+    def _outliers_from_mask(self, columns: List[str], mask: np.ndarray,
+                            max_indices: Optional[int]) -> Dict[str, Dict[str, Any]]:
+        outliers = {}
+        for i, col in enumerate(columns):
+            positions = np.flatnonzero(mask[:, i])
+            outliers[col] = {
+                'count': int(positions.size),
+                'indices': self._positions_to_index(positions[:max_indices])
+            }
+        return outliers
+
+    def _positions_to_index(self, positions) -> List:
+        return self.df.index[np.asarray(positions, dtype=np.int64)].tolist()
 
     def check_missing_values(self, threshold: float = 0.1) -> Dict[str, float]:
         """
@@ -19,14 +337,12 @@ class DataQualityValidator:
         Returns:
             Dictionary of columns and their missing value percentages
         """
-        missing_pct = (self.df.isnull().sum() / len(self.df))
-        problematic_cols = missing_pct[missing_pct > threshold]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            missing_pct = self._null_counts / self._n_rows
+        mask = missing_pct > threshold
+        problematic_cols = dict(zip(self.df.columns[mask], missing_pct[mask].tolist()))
 
-        self.validation_results['missing_values'] = {
-            'status': len(problematic_cols) == 0,
-            'details': problematic_cols.to_dict()
-        }
-        return problematic_cols.to_dict()
+        return self._record_missing(problematic_cols)
 
     def check_duplicates(self, subset: Optional[List[str]] = None) -> int:
         """
@@ -37,41 +353,113 @@ class DataQualityValidator:
         Returns:
             Number of duplicate rows found
         """
-        duplicate_count = len(self.df[self.df.duplicated(subset=subset)])
+        if subset and len(subset) > 1 and set(subset) == set(self.df.columns):
+            # A subset naming every column is the plain full-row check
+            subset = None
 
-        self.validation_results['duplicates'] = {
-            'status': duplicate_count == 0,
-            'details': {'duplicate_count': duplicate_count}
-        }
-        return duplicate_count
+        if self._lf is not None:
+            duplicate_count = self._lf.select(self._duplicate_expr(subset)).collect().item()
+        elif subset and len(subset) == 1:
+            duplicate_count = int(self.df[subset[0]].duplicated().sum())
+        elif subset:
+            duplicate_count = self._hashed_duplicate_count(subset)
+        else:
+            duplicate_count = int(self.df.duplicated().sum())
+
+        return self._record_duplicates(duplicate_count)
 
-    def check_outliers(self, columns: List[str], n_std: float = 3) -> Dict[str, List]:
+    def check_outliers(self, columns: List[str], n_std: float = 3,
+                       max_indices: Optional[int] = 100) -> Dict[str, Dict[str, Any]]:
         """
         Detect outliers using standard deviation method
 
         Args:
             columns: Numerical columns to check for outliers
             n_std: Number of standard deviations to use as threshold
+            max_indices: Maximum number of outlier indices to report per column, None for all
         Returns:
-            Dictionary with outlier indices for each column
+            Dictionary with the outlier count and first outlier indices for each column
         """
-        outliers = {}
+        columns = self._numeric_columns(columns)
 
-        for col in columns:
-            if pd.api.types.is_numeric_dtype(self.df[col]):
-                mean = self.df[col].mean()
-                std = self.df[col].std()
-                outlier_idx = self.df[
-                    (self.df[col] < mean - n_std * std) |
-                    (self.df[col] > mean + n_std * std)
-                ].index.tolist()
-                outliers[col] = outlier_idx
-
-        self.validation_results['outliers'] = {
-            'status': all(len(idx) == 0 for idx in outliers.values()),
-            'details': outliers
-        }
-        return outliers
+        mask = self._outlier_mask(self._column_matrix(columns), n_std)
+        outliers = self._outliers_from_mask(columns, mask, max_indices)
+
+        return self._record_outliers(outliers)
+
+    def check_outliers_iqr(self, columns: List[str], k: float = 1.5,
+                           max_indices: Optional[int] = 100) -> Dict[str, Dict[str, Any]]:
+        """
+        Detect outliers outside the Tukey fences Q1 - k*IQR and Q3 + k*IQR
+
+        Better suited than the standard deviation rule to heavy-tailed data.
+
+        Args:
+            columns: Numerical columns to check for outliers
+            k: Multiple of the interquartile range to use as threshold
+            max_indices: Maximum number of outlier indices to report per column, None for all
+        Returns:
+            Dictionary with the outlier count and first outlier indices for each column
+        """
+        columns = self._numeric_columns(columns)
+        A = self._column_matrix(columns)
+        if A.dtype != np.float64:
+            # Quartiles of float32-rounded values move the fences, so use exact values
+            A = self.df[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+
+        lower = np.full(len(columns), np.nan)
+        upper = np.full(len(columns), np.nan)
+        for j in range(len(columns)):
+            x = A[:, j]
+            x = x[~np.isnan(x)]
+            if x.size:
+                q1, q3 = _partition_quantiles(x, [0.25, 0.75])
+                lower[j] = q1 - k * (q3 - q1)
+                upper[j] = q3 + k * (q3 - q1)
+
+        mask = (A < lower) | (A > upper)
+        outliers = self._outliers_from_mask(columns, mask, max_indices)
+
+        return self._record_outliers(outliers, check='outliers_iqr')
+
+    def run_all_checks(self, threshold: float = 0.1, n_std: float = 3,
+                       max_indices: Optional[int] = 100) -> None:
+        """
+        Run the missing value, duplicate and outlier checks together
+
+        With Polars available the null counts and duplicate check are
+        composed into a single LazyFrame query; otherwise they come from
+        pandas. Outliers reuse one float64 matrix of the numeric columns.
+
+        Args:
+            threshold: Maximum acceptable percentage of missing values (0-1)
+            n_std: Number of standard deviations to use as outlier threshold
+            max_indices: Maximum number of outlier indices to report per column
+        """
+        if self._lf is None:
+            self._run_all_fused(threshold, n_std, max_indices)
+            return
+
+        query = [self._duplicate_expr(None, name='duplicates')]
+        if self._null_count_cache is None:
+            query.append(pl.concat_list(pl.all().null_count()).alias('null_counts'))
+        row = self._lf.select(query).collect().row(0, named=True)
+        if 'null_counts' in row:
+            self._null_count_cache = np.asarray(row['null_counts'], dtype=np.int64)
+
+        self.check_missing_values(threshold)
+        self._record_duplicates(row['duplicates'])
+
+        columns, A = self._numeric_matrix()
+        self._record_outliers(self._outliers_from_mask(columns, self._outlier_mask(A, n_std), max_indices))
+
+    def _run_all_fused(self, threshold: float, n_std: float, max_indices: Optional[int]) -> None:
+        """Run all checks with pandas/NumPy, reusing the cached null counts and numeric matrix"""
+        self.check_missing_values(threshold)
+        self.check_duplicates()
+
+        columns, A = self._numeric_matrix()
+        self._record_outliers(self._outliers_from_mask(columns, self._outlier_mask(A, n_std), max_indices))
 
     def validate_schema(self, expected_schema: Dict[str, str]) -> List[str]:
         """
@@ -82,45 +470,472 @@ class DataQualityValidator:
         Returns:
             List of columns with mismatched data types
         """
-        mismatched_cols = []
+        mismatched_cols = [
+            col for col, expected_type in expected_schema.items()
+            if self._dtypes.get(col) != expected_type
+        ]
 
-        for col, expected_type in expected_schema.items():
-            if col in self.df.columns:
-                actual_type = str(self.df[col].dtype)
-                if actual_type != expected_type:
-                    mismatched_cols.append(col)
-            else:
-                mismatched_cols.append(col)
+        return self._record_schema(mismatched_cols)
 
-        self.validation_results['schema'] = {
-            'status': len(mismatched_cols) == 0,
-            'details': {'mismatched_columns': mismatched_cols}
-        }
-        return mismatched_cols
+    def run_spec(self, spec: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Run every check named in a validation spec in one call
 
-    def get_validation_summary(self) -> Dict[str, Any]:
-        """Return complete validation results"""
-        return {
-            'timestamp': datetime.now().isoformat(),
-            'total_rows': len(self.df),
-            'total_columns': len(self.df.columns),
-            'checks': self.validation_results,
-            'overall_status': all(check['status'] for check in self.validation_results.values())
-        }
+        All checks share the validator's cached null counts, numeric matrix
+        and dtypes, so each is computed at most once per frame.
+
+        Args:
+            spec: Mapping with any of the keys missing_threshold (float),
+                duplicates (true for all columns or a list of columns),
+                outlier_cols (list, empty for all numeric columns), n_std,
+                iqr_outlier_cols, iqr_k, max_indices and schema (column
+                name to dtype); data is read by run_spec_file()
+        Returns:
+            Validation summary covering the checks that were run
+        Raises:
+            ValueError: If the spec has keys outside SPEC_KEYS, a duplicates value
+                that is not a bool or list, or names no check, so a malformed
+                spec cannot pass as an empty or wrong, successful run
+        """
+        unknown = [str(key) for key in spec if key not in SPEC_KEYS]
+        if unknown:
+            raise ValueError(f"Unknown spec keys: {', '.join(unknown)}")
+        if not isinstance(spec.get('duplicates', False), (bool, list)):
+            raise ValueError("Spec key duplicates must be true, false or a list of columns")
+        if not spec.get('duplicates') and not any(key in spec for key in SPEC_CHECK_KEYS if key != 'duplicates'):
+            raise ValueError(f"Spec names no checks; expected one of {', '.join(SPEC_CHECK_KEYS)}")
+
+        if 'missing_threshold' in spec:
+            self.check_missing_values(spec['missing_threshold'])
+        if spec.get('duplicates'):
+            subset = spec['duplicates'] if isinstance(spec['duplicates'], list) else None
+            self.check_duplicates(subset)
+        if 'outlier_cols' in spec:
+            self.check_outliers(
+                spec['outlier_cols'] or self._numeric_cols,
+                spec.get('n_std', 3),
+                spec.get('max_indices', 100)
+            )
+        if 'iqr_outlier_cols' in spec:
+            self.check_outliers_iqr(
+                spec['iqr_outlier_cols'] or self._numeric_cols,
+                spec.get('iqr_k', 1.5),
+                spec.get('max_indices', 100)
+            )
+        if 'schema' in spec:
+            self.validate_schema(spec['schema'])
+        return self.get_validation_summary()
+
+class StreamingDataQualityValidator(ValidationResultsMixin):
+    """
+    Validate data fed in chunks without holding the full frame in memory
+
+    update() accumulates running null counts, per-column mean/M2 (Welford,
+    merged chunk by chunk), t-digest quantile sketches when crick is
+    installed, and a set of row hashes for duplicate detection. Outlier
+    indices depend on the final statistics, so the outlier checks take a
+    second pass over the chunks.
+
+    The numeric columns are fixed by the first chunk and read as float64 in
+    every chunk, so a column that is int64 in one chunk and float64 in a
+    later one (e.g. read_csv(chunksize=...) meeting NaNs) hashes the same
+    way. Text columns must keep one dtype across chunks, and a numeric column
+    that holds non-numeric text in a later chunk raises ValueError; pass
+    dtype= to the chunk reader for such files, as DataQualityUI.iter_chunks()
+    does for text columns and columns left empty by the first chunk.
+    """
+
+    def __init__(self):
+        self.results = ValidationResults()
+        self._n_rows = 0
+        self._n_cols = 0
+        self._columns = None
+        self._null_counts = None
+        self._stat_columns = []
+        self._count = None
+        self._mean = None
+        self._m2 = None
+        self._digests = None
+        self._row_hashes = set()
+        self._duplicate_count = 0
+
+    def update(self, chunk: pd.DataFrame) -> None:
+        """Fold one chunk of rows into the running statistics"""
+        if self._columns is None:
+            self._columns = chunk.columns
+            self._n_cols = len(chunk.columns)
+            self._null_counts = np.zeros(len(chunk.columns), dtype=np.int64)
+            self._stat_columns = chunk.select_dtypes(include=[np.number]).columns.tolist()
+            self._count = np.zeros(len(self._stat_columns), dtype=np.int64)
+            self._mean = np.zeros(len(self._stat_columns))
+            self._m2 = np.zeros(len(self._stat_columns))
+            if TDigest is not None:
+                self._digests = [TDigest() for _ in self._stat_columns]
+
+        self._n_rows += len(chunk)
+        self._null_counts += chunk.isnull().sum().to_numpy()
+
+        try:
+            A = chunk[self._stat_columns].to_numpy(dtype=np.float64, na_value=np.nan)
+        except (TypeError, ValueError):
+            changed = [col for col in self._stat_columns if not pd.api.types.is_numeric_dtype(chunk[col])]
+            raise ValueError(
+                f"Columns {changed} were numeric in the first chunk but not in this one; "
+                "pass dtype= to the chunk reader to fix their types"
+            ) from None
+        # Adding 0.0 turns -0.0 into 0.0, which compares equal but hashes differently
+        A = A + 0.0
+        count = (~np.isnan(A)).sum(axis=0)
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', RuntimeWarning)
+            mean = np.where(count > 0, np.nanmean(A, axis=0), 0.0)
+        m2 = np.nansum((A - mean) ** 2, axis=0)
+
+        total = self._count + count
+        safe_total = np.maximum(total, 1)
+        delta = mean - self._mean
+        self._mean = self._mean + delta * count / safe_total
+        self._m2 = self._m2 + m2 + delta ** 2 * self._count * count / safe_total
+        self._count = total
+
+        if self._digests is not None:
+            for j, digest in enumerate(self._digests):
+                x = A[:, j]
+                digest.update(x[~np.isnan(x)])
+
+        # Hash the float64 view of the numeric columns so per-chunk dtype
+        # inference cannot make equal rows hash differently
+        hash_frame = chunk.copy(deep=False)
+        hash_frame[self._stat_columns] = A
+        hashes = pd.unique(pd.util.hash_pandas_object(hash_frame, index=False).to_numpy())
+        seen = len(self._row_hashes)
+        self._row_hashes.update(hashes.tolist())
+        self._duplicate_count += len(chunk) - (len(self._row_hashes) - seen)
+
+    def check_missing_values(self, threshold: float = 0.1) -> Dict[str, float]:
+        """
+        Check for columns with missing values above specified threshold
+
+        Args:
+            threshold: Maximum acceptable percentage of missing values (0-1)
+        Returns:
+            Dictionary of columns and their missing value percentages
+        """
+        with np.errstate(invalid='ignore', divide='ignore'):
+            missing_pct = self._null_counts / self._n_rows
+        mask = missing_pct > threshold
+        return self._record_missing(dict(zip(self._columns[mask], missing_pct[mask].tolist())))
+
+    def check_duplicates(self) -> int:
+        """
+        Check for duplicate rows across all chunks seen so far
+
+        Returns:
+            Number of duplicate rows found
+        """
+        return self._record_duplicates(self._duplicate_count)
+
+    def check_outliers(self, chunks, columns: Optional[List[str]] = None, n_std: float = 3,
+                       max_indices: Optional[int] = 100) -> Dict[str, Dict[str, Any]]:
+        """
+        Detect outliers using standard deviation method
+
+        Args:
+            chunks: Second iteration over the same chunks passed to update()
+            columns: Numerical columns to check, defaults to all numeric columns
+            n_std: Number of standard deviations to use as threshold
+            max_indices: Maximum number of outlier indices to report per column, None for all
+        Returns:
+            Dictionary with the outlier count and first outlier indices for each column
+        """
+        columns, idx = self._stat_indices(columns)
+        mean = self._mean[idx]
+        with np.errstate(invalid='ignore', divide='ignore'):
+            std = np.sqrt(self._m2[idx] / (self._count[idx] - 1))
+            std[self._count[idx] < 2] = np.nan
+
+        outliers = self._flag_outliers(chunks, columns, mean - n_std * std, mean + n_std * std, max_indices)
+        return self._record_outliers(outliers)
+
+    def check_outliers_iqr(self, chunks, columns: Optional[List[str]] = None, k: float = 1.5,
+                           max_indices: Optional[int] = 100) -> Dict[str, Dict[str, Any]]:
+        """
+        Detect outliers outside the Tukey fences, with quartiles from t-digest sketches
+
+        Args:
+            chunks: Second iteration over the same chunks passed to update()
+            columns: Numerical columns to check, defaults to all numeric columns
+            k: Multiple of the interquartile range to use as threshold
+            max_indices: Maximum number of outlier indices to report per column, None for all
+        Returns:
+            Dictionary with the outlier count and first outlier indices for each column
+        """
+        if self._digests is None:
+            raise ImportError("crick is required for streaming IQR outlier detection")
+
+        columns, idx = self._stat_indices(columns)
+        q1 = np.array([self._digests[i].quantile(0.25) for i in idx])
+        q3 = np.array([self._digests[i].quantile(0.75) for i in idx])
+
+        outliers = self._flag_outliers(chunks, columns, q1 - k * (q3 - q1), q3 + k * (q3 - q1), max_indices)
+        return self._record_outliers(outliers, check='outliers_iqr')
+
+    def _stat_indices(self, columns: Optional[List[str]]):
+        lookup = {col: i for i, col in enumerate(self._stat_columns)}
+        columns = [col for col in (columns or self._stat_columns) if col in lookup]
+        return columns, [lookup[col] for col in columns]
+
+    def _flag_outliers(self, chunks, columns: List[str], lower: np.ndarray, upper: np.ndarray,
+                       max_indices: Optional[int]) -> Dict[str, Dict[str, Any]]:
+        """Second pass: count and sample the rows falling outside [lower, upper] per column"""
+        outliers = {col: {'count': 0, 'indices': []} for col in columns}
+        for chunk in chunks:
+            A = chunk[columns].to_numpy(dtype=np.float64, na_value=np.nan)
+            mask = (A < lower) | (A > upper)
+            for i, col in enumerate(columns):
+                positions = np.flatnonzero(mask[:, i])
+                result = outliers[col]
+                result['count'] += int(positions.size)
+                if max_indices is not None:
+                    positions = positions[:max(max_indices - len(result['indices']), 0)]
+                result['indices'].extend(chunk.index[positions].tolist())
+        return outliers
+
+def read_csv(file_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """
+    Read a CSV file with the multi-threaded Arrow reader when available
+
+    A full Arrow load also writes a Parquet mirror under SCHEMA_CACHE_DIR,
+    which later loads read instead while it is newer than the CSV.
+    Only the given columns are parsed when columns is set, and column
+    types saved by DataQualityUI.save_arrow_schema() replace type inference.
+    Empty fields load as nulls and dates stay strings, as with pandas.
+    Files Arrow rejects or whose header pandas would rename, such as short
+    rows or repeated and blank names, are read with pandas instead.
+    """
+    if pa is None:
+        return pd.read_csv(file_path, usecols=columns)
+
+    mirror_path = _cache_path(file_path, 'parquet')
+    if os.path.exists(mirror_path) and os.path.getmtime(mirror_path) >= os.path.getmtime(file_path):
+        try:
+            if _pandas_names(pq.read_schema(mirror_path).names):
+                return read_parquet(mirror_path, columns)
+        except (OSError, pa.ArrowException):
+            # An unreadable mirror is rebuilt from the CSV below
+            pass
+
+    try:
+        inferred_types = _pandas_compatible_types(file_path, columns)
+        column_types = {**inferred_types, **_load_arrow_schema(file_path)}
+        try:
+            table = _arrow_read_csv(file_path, columns, column_types)
+        except pa.ArrowInvalid:
+            if column_types == inferred_types:
+                raise
+            # The file no longer matches the saved types, so infer them again
+            table = _arrow_read_csv(file_path, columns, inferred_types)
+    except pa.ArrowInvalid:
+        return pd.read_csv(file_path, usecols=columns)
+    if not _pandas_names(table.column_names):
+        return pd.read_csv(file_path, usecols=columns)
+
+    if columns is None:
+        try:
+            os.makedirs(SCHEMA_CACHE_DIR, exist_ok=True)
+            pq.write_table(table, mirror_path, compression='zstd')
+        except OSError:
+            pass
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+def _arrow_read_csv(file_path: str, columns: Optional[List[str]], column_types: Dict[str, Any]):
+    return pa_csv.read_csv(
+        file_path,
+        read_options=pa_csv.ReadOptions(use_threads=True, block_size=64 << 20),
+        convert_options=pa_csv.ConvertOptions(
+            include_columns=columns, column_types=column_types, strings_can_be_null=True
+        )
+    )
+
+def _pandas_names(names: List[str]) -> bool:
+    """Whether pandas would keep these header names as they are (no a.1 or Unnamed: 0)"""
+    return '' not in names and len(set(names)) == len(names)
+
+def _pandas_compatible_types(file_path: str, columns: Optional[List[str]] = None) -> Dict[str, Any]:
+    """
+    Arrow column types that keep CSV inference in line with pandas
+
+    Arrow parses date-like text into date/timestamp columns where pandas
+    keeps strings, so those columns, found from the first block, are read
+    as strings instead.
+    """
+    convert_options = pa_csv.ConvertOptions(include_columns=columns, strings_can_be_null=True)
+    with pa_csv.open_csv(file_path, read_options=pa_csv.ReadOptions(block_size=1 << 20),
+                         convert_options=convert_options) as reader:
+        schema = reader.schema
+    return {
+        field.name: pa.string() for field in schema
+        if pa.types.is_temporal(field.type)
+    }
+
+def _cache_path(file_path: str, suffix: str) -> str:
+    digest = hashlib.sha1(os.path.abspath(file_path).encode()).hexdigest()
+    return os.path.join(SCHEMA_CACHE_DIR, f"{digest}.{suffix}")
+
+def _load_arrow_schema(file_path: str) -> Dict[str, Any]:
+    """Return the Arrow column types saved for a CSV file, if any"""
+    try:
+        with open(_cache_path(file_path, 'schema.json')) as f:
+            schema = json.load(f)
+        return {col: pa.type_for_alias(alias) for col, alias in schema.items()}
+    except (OSError, ValueError):
+        return {}
+
+def read_parquet(file_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    if pa is None:
+        return pd.read_parquet(file_path, columns=columns)
+    table = pq.read_table(file_path, columns=columns, use_threads=True)
+    return table.to_pandas(self_destruct=True, split_blocks=True)
+
+def read_excel(file_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    return pd.read_excel(file_path, usecols=columns)
+
+def read_file(file_path: str, columns: Optional[List[str]] = None) -> pd.DataFrame:
+    """Read a file with the reader matching its extension"""
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension == '.parquet':
+        return read_parquet(file_path, columns)
+    if extension in ('.xls', '.xlsx'):
+        return read_excel(file_path, columns)
+    return read_csv(file_path, columns)
 
 class DataQualityUI:
     def __init__(self):
         self.validator = None
         self.df = None
+        self.file_path = None
+        self.reader = None
+        self.usecols = None
+        if os.name == 'nt':
+            self.enable_ansi_escapes()
+
+    def enable_ansi_escapes(self):
+        """Turn on VT processing so the Windows console understands CLEAR_SCREEN"""
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            # ENABLE_PROCESSED_OUTPUT | ENABLE_VIRTUAL_TERMINAL_PROCESSING
+            kernel32.SetConsoleMode(handle, mode.value | 0x0001 | 0x0004)
 
     def clear_screen(self):
-        os.system('cls' if os.name == 'nt' else 'clear')
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
 
     def print_header(self):
         print("\n" + "="*50)
         print("       Data Quality Validation Tool")
         print("="*50 + "\n")
 
+    def save_arrow_schema(self):
+        """Save the loaded CSV's column types so later loads skip Arrow type inference"""
+        if pa is None or self.reader != read_csv:
+            return
+        schema = {}
+        for col, dtype in self.df.dtypes.items():
+            try:
+                schema[str(col)] = str(pa.from_numpy_dtype(dtype))
+            except (TypeError, pa.ArrowException):
+                # Object and extension dtypes are left to inference
+                continue
+        try:
+            os.makedirs(SCHEMA_CACHE_DIR, exist_ok=True)
+            with open(_cache_path(self.file_path, 'schema.json'), 'w') as f:
+                json.dump(schema, f)
+        except OSError:
+            pass
+
+    def load_file(self, reader, file_type: str) -> bool:
+        file_path = input(f"\nEnter {file_type} file path: ")
+        columns = input("Enter columns of interest (comma-separated) or press Enter for all: ")
+        usecols = [col.strip() for col in columns.split(',')] if columns else None
+        try:
+            self.df = reader(file_path, usecols)
+            print("\nData loaded successfully!")
+            self.validator = DataQualityValidator(self.df)
+            self.file_path, self.reader, self.usecols = file_path, reader, usecols
+            time.sleep(2)
+            return True
+        except Exception as e:
+            print(f"\nError loading file: {str(e)}")
+            input("\nPress Enter to continue...")
+            return False
+
+    def read_header(self) -> List[str]:
+        """Return the column names of the loaded file without reading its data"""
+        if self.reader == read_parquet:
+            if pa is not None:
+                return pq.read_schema(self.file_path).names
+            return pd.read_parquet(self.file_path).columns.tolist()
+        if self.reader == read_excel:
+            return pd.read_excel(self.file_path, nrows=0).columns.tolist()
+        return pd.read_csv(self.file_path, nrows=0).columns.tolist()
+
+    def ensure_columns(self, columns: List[str]):
+        """Read columns that were skipped at load time and append them to the data"""
+        if self.usecols is None:
+            return
+        missing = [col for col in dict.fromkeys(columns) if col not in self.df.columns]
+        if missing:
+            available = set(self.read_header())
+            missing = [col for col in missing if col in available]
+        if not missing:
+            return
+        self.df = pd.concat([self.df, self.reader(self.file_path, missing)], axis=1)
+        self.usecols = self.usecols + missing
+        self.validator.refresh(self.df)
+
+    def iter_chunks(self, file_path: str, chunksize: int = 1_000_000):
+        """Yield the rows of a CSV or Parquet file as DataFrames with a running index"""
+        if file_path.endswith('.parquet') and pa is not None:
+            offset = 0
+            for batch in pq.ParquetFile(file_path).iter_batches(batch_size=chunksize):
+                chunk = batch.to_pandas()
+                chunk.index = pd.RangeIndex(offset, offset + len(chunk))
+                offset += len(chunk)
+                yield chunk
+        else:
+            # read_csv infers types per chunk, so a text column that is empty
+            # for a whole chunk comes back float64 and hashes differently.
+            # Fix text columns, and columns the first chunk leaves empty, as str.
+            with pd.read_csv(file_path, chunksize=chunksize) as reader:
+                first = next(reader, None)
+            dtype = None
+            if first is not None:
+                dtype = {
+                    col: str for col in first.columns
+                    if not pd.api.types.is_numeric_dtype(first[col]) or first[col].isna().all()
+                }
+            yield from pd.read_csv(file_path, chunksize=chunksize, dtype=dtype)
+
+    def validate_in_chunks(self):
+        file_path = input("\nEnter CSV or Parquet file path: ")
+        threshold = float(input("Enter missing values threshold (default=0.1): ") or 0.1)
+        n_std = float(input("Enter number of standard deviations (default=3): ") or 3)
+        try:
+            validator = StreamingDataQualityValidator()
+            for chunk in self.iter_chunks(file_path):
+                validator.update(chunk)
+            validator.check_missing_values(threshold)
+            validator.check_duplicates()
+            validator.check_outliers(self.iter_chunks(file_path), n_std=n_std)
+            print("\nValidation Summary:")
+            print(validator.get_validation_summary())
+        except Exception as e:
+            print(f"\nError validating file: {str(e)}")
+        input("\nPress Enter to continue...")
+
     def load_data(self):
         while True:
             self.clear_screen()
@@ -128,35 +943,28 @@ class DataQualityUI:
             print("Load Data Options:")
             print("1. Load CSV file")
             print("2. Load Excel file")
-            print("3. Exit")
+            print("3. Load Parquet file")
+            print("4. Validate large file in chunks")
+            print("5. Exit")
 
-            choice = input("\nEnter your choice (1-3): ")
+            choice = input("\nEnter your choice (1-5): ")
 
             if choice == '1':
-                file_path = input("\nEnter CSV file path: ")
-                try:
-                    self.df = pd.read_csv(file_path)
-                    print("\nData loaded successfully!")
-                    self.validator = DataQualityValidator(self.df)
-                    time.sleep(2)
+                if self.load_file(read_csv, "CSV"):
                     return True
-                except Exception as e:
-                    print(f"\nError loading file: {str(e)}")
-                    input("\nPress Enter to continue...")
 
             elif choice == '2':
-                file_path = input("\nEnter Excel file path: ")
-                try:
-                    self.df = pd.read_excel(file_path)
-                    print("\nData loaded successfully!")
-                    self.validator = DataQualityValidator(self.df)
-                    time.sleep(2)
+                if self.load_file(read_excel, "Excel"):
                     return True
-                except Exception as e:
-                    print(f"\nError loading file: {str(e)}")
-                    input("\nPress Enter to continue...")
 
             elif choice == '3':
+                if self.load_file(read_parquet, "Parquet"):
+                    return True
+
+            elif choice == '4':
+                self.validate_in_chunks()
+
+            elif choice == '5':
                 return False
 
     def display_data_preview(self):
@@ -196,23 +1004,32 @@ class DataQualityUI:
             elif choice == '2':
                 columns = input("\nEnter column names to check for duplicates (comma-separated) or press Enter for all: ")
                 subset = [col.strip() for col in columns.split(',')] if columns else None
+                if subset:
+                    self.ensure_columns(subset)
                 results = self.validator.check_duplicates(subset)
                 print(f"\nFound {results} duplicate rows")
                 input("\nPress Enter to continue...")
 
             elif choice == '3':
                 columns = input("\nEnter numerical column names to check for outliers (comma-separated): ")
-                n_std = float(input("Enter number of standard deviations (default=3): ") or 3)
+                method = input("Enter detection method, std or iqr (default=std): ").strip().lower()
                 cols = [col.strip() for col in columns.split(',')]
-                results = self.validator.check_outliers(cols, n_std)
+                if method == 'iqr':
+                    k = float(input("Enter IQR multiplier (default=1.5): ") or 1.5)
+                    self.ensure_columns(cols)
+                    results = self.validator.check_outliers_iqr(cols, k)
+                else:
+                    n_std = float(input("Enter number of standard deviations (default=3): ") or 3)
+                    self.ensure_columns(cols)
+                    results = self.validator.check_outliers(cols, n_std)
                 print("\nOutlier Detection Results:")
                 print(results)
                 input("\nPress Enter to continue...")
 
             elif choice == '4':
                 print("\nCurrent column types:")
-                for col in self.df.columns:
-                    print(f"{col}: {self.df[col].dtype}")
+                for col, dtype in self.df.dtypes.items():
+                    print(f"{col}: {dtype}")
                 print("\nEnter expected schema (example: column_name:dtype, ...)")
                 schema_input = input("Schema: ")
                 schema = {}
@@ -220,18 +1037,17 @@ class DataQualityUI:
                     if ':' in item:
                         col, dtype = item.split(':')
                         schema[col.strip()] = dtype.strip()
+                self.ensure_columns(list(schema))
                 results = self.validator.validate_schema(schema)
+                if not results:
+                    self.save_arrow_schema()
                 print("\nSchema Validation Results:")
                 print(results)
                 input("\nPress Enter to continue...")
 
             elif choice == '5':
                 print("\nRunning all checks...")
-                self.validator.check_missing_values()
-                self.validator.check_duplicates()
-                self.validator.check_outliers(
-                    self.df.select_dtypes(include=[np.number]).columns.tolist()
-                )
+                self.validator.run_all_checks()
                 print("\nAll checks completed!")
                 input("\nPress Enter to continue...")
 
@@ -278,6 +1094,39 @@ class DataQualityUI:
                 print("\nThank you for using the Data Quality Validation Tool!")
                 break
 
+def load_spec(spec_path: str) -> Dict[str, Any]:
+    """Load a validation spec from a JSON or YAML file"""
+    with open(spec_path) as f:
+        if spec_path.endswith(('.yml', '.yaml')):
+            if yaml is None:
+                raise ImportError("PyYAML is required for YAML specs")
+            spec = yaml.safe_load(f)
+        else:
+            spec = json.load(f)
+    if not isinstance(spec, dict):
+        raise ValueError(f"Spec {spec_path} must be a mapping of spec keys, got {type(spec).__name__}")
+    return spec
+
+def run_spec_file(spec_path: str, data_path: Optional[str] = None) -> bool:
+    """Validate a data file against a spec without the interactive menu"""
+    spec = load_spec(spec_path)
+    data_path = data_path or spec.get('data')
+    if not data_path:
+        raise ValueError("No data file given on the command line or in the spec")
+
+    df = read_file(data_path)
+    summary = DataQualityValidator(df).run_spec(spec)
+    print(json.dumps(summary, indent=2, default=str))
+    return summary['overall_status']
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Data Quality Validation Tool")
+    parser.add_argument('data', nargs='?', help="data file to validate in script mode")
+    parser.add_argument('--spec', help="JSON or YAML validation spec; runs all its checks and exits")
+    args = parser.parse_args()
+
+    if args.spec:
+        sys.exit(0 if run_spec_file(args.spec, args.data) else 1)
+
     ui = DataQualityUI()
     ui.main_menu()